@@ -25,10 +25,26 @@ Python 3.10+ / Windows 10+ で動作確認想定
 
 import sys
 import time
+import asyncio
 import datetime
-import re
 import socket
-from typing import List, Optional, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np      # 任意（Numba とあわせて導入されていれば受信データの走査を JIT コンパイル）
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from utr_parse import scan_frames as _scan_frames_c  # 任意（utr_parse.pyx をビルドした場合のみ）
+except ImportError:
+    _scan_frames_c = None
+
+# 受信データはコピーを避けるため memoryview のまま扱う箇所がある
+BytesLike = Union[bytes, bytearray, memoryview]
 
 # ==== 定数定義（USB版と同じ）====================================================
 HEADER_LENGTH     = 4        # STX, アドレス, コマンド, データ長 (各1バイト)
@@ -45,11 +61,20 @@ CMD_LOCATION      = 2        # コマンドの位置（3バイト目）
 DETAIL_LOCATION   = 4        # 詳細コマンド位置（5バイト目）
 DETAIL_ROM: bytes = b'\x90'  # ROMバージョン読み取り詳細コマンド
 DETAIL_INV: bytes = b'\x10'  # インベントリ詳細コマンド
-
-OUTPUT_CH_FREQ_LIST = [916.0, 916.2, 916.4, 916.6, 916.8, 917.0, 917.2, 917.4, 917.6, 917.8,
+STX_I             = STX[0]   # 受信データとの比較用（整数値）
+ETX_I             = ETX[0]
+CR_I              = CR[0]
+ACK_I             = ACK[0]
+NACK_I            = NACK[0]
+INV_I             = INV[0]
+DETAIL_INV_I      = DETAIL_INV[0]
+DETAIL_ROM_I      = DETAIL_ROM[0]
+SOCKET_RCVBUF_SIZE = 65536    # ソケットの受信バッファサイズ（SO_RCVBUF）
+
+OUTPUT_CH_FREQ_LIST = (916.0, 916.2, 916.4, 916.6, 916.8, 917.0, 917.2, 917.4, 917.6, 917.8,
                        918.0, 918.2, 918.4, 918.6, 918.8, 919.0, 919.2, 919.4, 919.6, 919.8,
                        920.0, 920.2, 920.4, 920.6, 920.8, 921.0, 921.2, 921.4, 921.6, 921.8,
-                       922.0, 922.2, 922.4, 922.6, 922.8, 923.0, 923.2, 923.4]
+                       922.0, 922.2, 922.4, 922.6, 922.8, 923.0, 923.2, 923.4)
 
 # ==== UTR用 送信コマンド定義（USB版と同じ）=======================================
 COMMANDS = {
@@ -66,11 +91,11 @@ COMMANDS = {
 # =============================================================================
 #  ユーティリティ（SUM 計算/検証、NACK解析、RSSI値計算 等）
 # =============================================================================
-def calculate_sum_value(data: bytes) -> int:
+def calculate_sum_value(data: BytesLike) -> int:
     """STX〜ETX までの合計値(下位1バイト)を算出して返す。"""
     return sum(data) & 0xFF
 
-def verify_sum_value(data_frame: bytes) -> bool:
+def verify_sum_value(data_frame: BytesLike) -> bool:
     """データ末尾の SUM と、STX〜ETX までの合計値が一致するか検証する。"""
     if len(data_frame) < HEADER_LENGTH + FOOTER_LENGTH:
         return False
@@ -78,7 +103,15 @@ def verify_sum_value(data_frame: bytes) -> bool:
     calc     = calculate_sum_value(data_frame[:-2])
     return expected == calc
 
-def parse_nack_response(nack_response: bytes) -> str:
+def _is_ack(response: bytes) -> bool:
+    """先頭が STX で、コマンド位置が ACK のレスポンスかどうかを返す。"""
+    return len(response) > CMD_LOCATION and response[0] == STX_I and response[CMD_LOCATION] == ACK_I
+
+def _is_nack(response: bytes) -> bool:
+    """先頭が STX で、コマンド位置が NACK のレスポンスかどうかを返す。"""
+    return len(response) > CMD_LOCATION and response[0] == STX_I and response[CMD_LOCATION] == NACK_I
+
+def parse_nack_response(nack_response: BytesLike) -> str:
     """NACK 応答のエラーコードを簡易的に日本語に変換して返す（例示）。"""
     if len(nack_response) < (HEADER_LENGTH + FOOTER_LENGTH):
         return "Invalid NACK response"
@@ -99,71 +132,120 @@ def parse_nack_response(nack_response: bytes) -> str:
     }
     return error_messages.get(error_code, f"Unknown NACK error (0x{error_code:02X})")
 
-def convert_rssi(rssi_hex_value: str) -> float:
+def convert_rssi(rssi_bytes: BytesLike) -> float:
     """
     RSSI 値(無線信号強度の指標)を計算して返す。
-    レスポンスの6〜7バイト目を符号付き16ビットとして扱い、10進数化してから10で割る。
+    レスポンスの6〜7バイト目を符号付き16ビット(ビッグエンディアン)として扱い、10で割る。
     """
-    binary_value = bin(int(rssi_hex_value, 16))[2:]
-    inverted_binary_value = ''.join('1' if bit == '0' else '0' for bit in binary_value)
-    added_binary_value = bin(int(inverted_binary_value, 2) + 1)[2:]
-    rssi_value = int(added_binary_value, 2)
-    return -rssi_value / 10
+    return int.from_bytes(rssi_bytes, byteorder='big', signed=True) / 10
 
 # =============================================================================
 #  受信フレーム解析（USB版のロジック踏襲）
 # =============================================================================
-def parse_data_frame(data: bytes, index: int) -> Tuple[Optional[bytes], int]:
-    """STX〜CR までの 1 フレームを取り出して返す。なければ (None, index) を返す。"""
+def parse_data_frame(data: memoryview, index: int) -> Tuple[Optional[memoryview], int]:
+    """STX〜CR までの 1 フレームを（コピーせず memoryview のまま）取り出して返す。なければ (None, index) を返す。"""
     if len(data) >= (index + HEADER_LENGTH + FOOTER_LENGTH):
         data_length = data[index + 3] + HEADER_LENGTH + FOOTER_LENGTH
         if len(data) >= (index + data_length):
-            if data[(index + data_length) - 1] == CR[0]:
+            if data[(index + data_length) - 1] == CR_I:
                 return data[index:(index + data_length)], (index + data_length)
     return None, index
 
-def handle_inventory_response(data_frame: bytes, pc_uii_list: List[bytes], rssi_list: List[float]) -> None:
+def handle_inventory_response(data_frame: memoryview, pc_uii_list: List[bytes], rssi_list: List[float]) -> None:
     """インベントリのレスポンス 1 フレームから PC+UII と RSSI を抽出して格納する。"""
     pc_uii_length = data_frame[8]
-    pc_uii_data   = data_frame[9:9 + pc_uii_length]
+    pc_uii_data   = bytes(data_frame[9:9 + pc_uii_length])  # 保存時にのみ bytes 化
     pc_uii_list.append(pc_uii_data)
-    rssi_value = convert_rssi(data_frame[5:7].hex())
+    rssi_value = convert_rssi(data_frame[5:7])
     rssi_list.append(rssi_value)
 
-def check_inventory_ack_response(data_frame: bytes) -> int:
+def check_inventory_ack_response(data_frame: BytesLike) -> int:
     """インベントリ時 ACK フレームから読み取り枚数を抽出して返す。"""
     return int.from_bytes(data_frame[6:8], byteorder='little')
 
+def _scan_frames_py(data: bytes) -> Tuple[List[Tuple[int, int]], bool]:
+    """_scan_frames() の Python 実装。"""
+    spans: List[Tuple[int, int]] = []
+    # フレーム単位で読み進める（スライスはコピーを作らない memoryview で扱う）
+    mv = memoryview(data)
+    i = data.find(STX)
+    while i >= 0:
+        frame, next_idx = parse_data_frame(mv, i)
+        if frame is None:
+            # 途中で切れている場合は打ち切り（上位で追加の受信を検討）
+            break
+        if not verify_sum_value(frame):
+            return spans, True
+        spans.append((i, next_idx))
+        # 次の STX まで読み飛ばす（通常は直後がそのまま次フレーム）
+        i = data.find(STX, next_idx)
+    return spans, False
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_frames_jit(buf):
+        """_scan_frames() の Numba 版カーネル。buf は uint8 配列、戻り値の位置は (N, 2) 配列。"""
+        n = buf.shape[0]
+        spans = np.empty((n // (HEADER_LENGTH + FOOTER_LENGTH) + 1, 2), dtype=np.int64)
+        count = 0
+        i = 0
+        while i < n:
+            if buf[i] != STX_I:
+                i += 1
+                continue
+            if n < i + HEADER_LENGTH + FOOTER_LENGTH:
+                break
+            total_len = buf[i + 3] + HEADER_LENGTH + FOOTER_LENGTH
+            if n < i + total_len or buf[i + total_len - 1] != CR_I:
+                break
+            s = 0
+            for j in range(i, i + total_len - 2):
+                s += buf[j]
+            if (s & 0xFF) != buf[i + total_len - 2]:
+                return spans[:count], True
+            spans[count, 0] = i
+            spans[count, 1] = i + total_len
+            count += 1
+            i += total_len
+        return spans[:count], False
+
+def _scan_frames(data: bytes) -> Tuple[List[Sequence[int]], bool]:
+    """
+    受信データを走査し、SUM 検証済みフレームの (開始位置, 終了位置) を順に返す。
+    2 つ目の戻り値は、SUM 不一致で走査を打ち切ったかどうか。
+    C 拡張（utr_parse）がビルド済みならそれを、なければ Numba の JIT カーネルを、
+    どちらもなければ Python 実装を使う。
+    """
+    if _scan_frames_c is not None:
+        return _scan_frames_c(data)
+    if njit is None:
+        return _scan_frames_py(data)
+    spans, sum_error = _scan_frames_jit(np.frombuffer(data, dtype=np.uint8))
+    return spans.tolist(), sum_error  # 行ごとに変換せず、まとめて Python の int に変換
+
 def received_data_parse(data: bytes):
     """複数フレームを走査し、インベントリ結果を (pc_uii_list, rssi_list, expected_count) で返す。"""
     pc_uii_list: List[bytes] = []
     rssi_list:   List[float] = []
     expected_read_count: Optional[int] = None
 
-    i = 0
-    while i < len(data):
-        if data[i] == STX[0]:
-            frame, next_idx = parse_data_frame(data, i)
-            if frame:
-                if verify_sum_value(frame):
-                    command = bytes([frame[CMD_LOCATION]])
-                    detail  = bytes([frame[DETAIL_LOCATION]]) if len(frame) > DETAIL_LOCATION else b''
-
-                    if command == INV:
-                        handle_inventory_response(frame, pc_uii_list, rssi_list)
-                    elif command == ACK and detail == DETAIL_INV:
-                        expected_read_count = check_inventory_ack_response(frame)
-                    elif command == NACK:
-                        print(parse_nack_response(frame))
-                else:
-                    print("サム値が正しくありません（途中までの結果を返します）")
-                    return pc_uii_list, rssi_list, expected_read_count
-                i = next_idx
-            else:
-                # 途中で切れている場合は打ち切り（上位で追加の受信を検討）
-                break
-        else:
-            i += 1
+    spans, sum_error = _scan_frames(data)
+    mv = memoryview(data)
+    for start, end in spans:
+        frame   = mv[start:end]
+        command = frame[CMD_LOCATION]
+        detail  = frame[DETAIL_LOCATION] if len(frame) > DETAIL_LOCATION else None
+
+        if command == INV_I:
+            handle_inventory_response(frame, pc_uii_list, rssi_list)
+        elif command == ACK_I and detail == DETAIL_INV_I:
+            expected_read_count = check_inventory_ack_response(frame)
+        elif command == NACK_I:
+            print(parse_nack_response(frame))
+
+    if sum_error:
+        print("サム値が正しくありません（途中までの結果を返します）")
+        return pc_uii_list, rssi_list, expected_read_count
 
     if expected_read_count is not None and expected_read_count != len(pc_uii_list):
         print("タグの読み取り数とpc_uii_listの個数が一致しません")
@@ -173,138 +255,162 @@ def received_data_parse(data: bytes):
     return pc_uii_list, rssi_list, expected_read_count
 
 # =============================================================================
-#  LAN 通信（TCP）
+#  LAN 通信（TCP / asyncio）
 # =============================================================================
-class TcpSession:
+class AsyncTcpSession:
     """
-    UTR（LANモデル）と TCP で通信するための簡易セッション。
-    - recv は 1 バイトずつ読みつつ、USB 版と同等のパーサでフレームを確定。
-    - タイムアウトはソケットの timeout で管理。
+    UTR（LANモデル）と asyncio のストリームで通信するセッション。
+    - recv_frame() はヘッダ(4バイト)→データ長+フッタ(3バイト)の順に読み込んでフレームを確定する。
+    - タイムアウトは接続時は timeout、コマンドごとは communicate_async() の timeout で管理。
     """
     def __init__(self, host: str, port: int, timeout: float = 1.0) -> None:
         self.host = host
         self.port = port
         self.timeout = timeout
-        self.sock: Optional[socket.socket] = None
-
-    def connect(self) -> None:
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.settimeout(self.timeout)
-        self.sock.connect((self.host, self.port))
-
-    def close(self) -> None:
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._pending = bytearray()  # 同期を取り直すために読み戻したバイト
+
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout)
+        # 小さなコマンドを即時送信（Nagle 無効）し、インベントリ応答のまとまった受信に備える
+        sock = self.writer.get_extra_info('socket')
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
+
+    async def close(self) -> None:
         try:
-            if self.sock:
-                self.sock.close()
+            if self.writer:
+                self.writer.close()
+                await self.writer.wait_closed()
+        except OSError:
+            pass
         finally:
-            self.sock = None
+            self.reader = None
+            self.writer = None
+            self._pending.clear()
 
-    def send(self, data: bytes) -> None:
-        if not self.sock:
+    async def send(self, data: bytes) -> None:
+        if not self.writer:
             raise RuntimeError("ソケットが未接続です。connect() を先に呼び出してください。")
-        self.sock.sendall(data)
-
-    def recv(self, nbytes: int = 1) -> bytes:
-        if not self.sock:
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def _readexactly(self, nbytes: int) -> bytes:
+        """
+        読み戻し分を優先して、ちょうど nbytes バイトを読み込む。
+        読み戻し分は読み込みが完了してから消費する（途中でキャンセルされても失わない）。
+        """
+        if not self.reader:
             raise RuntimeError("ソケットが未接続です。connect() を先に呼び出してください。")
-        return self.sock.recv(nbytes)
+        if not self._pending:
+            return await self.reader.readexactly(nbytes)
+        head = bytes(self._pending[:nbytes])
+        if len(head) < nbytes:
+            head += await self.reader.readexactly(nbytes - len(head))
+        del self._pending[:nbytes]
+        return head
+
+    async def recv_frame(self) -> bytes:
+        """
+        STX/ETX/SUM/CR を満たすフレームを 1 つ受信して返す（不正なバイトは読み捨てて同期を取り直す）。
+        途中で切断された場合は asyncio.IncompleteReadError を送出する。
+        """
+        while True:
+            frame = b''
+            try:
+                if await self._readexactly(1) != STX:
+                    continue
+                frame  = STX
+                frame += await self._readexactly(HEADER_LENGTH - 1)
+                frame += await self._readexactly(frame[HEADER_LENGTH - 1] + FOOTER_LENGTH)
+            except asyncio.CancelledError:
+                # タイムアウト等で中断 → 読みかけのバイトを戻し、次回の受信で続きから確定する
+                self._pending[:0] = frame
+                raise
+            if frame[-1] == CR_I and frame[-FOOTER_LENGTH] == ETX_I and verify_sum_value(frame):
+                return frame
+            # 不正なフレーム → 先頭をずらして同期取り直し
+            self._pending[:0] = frame[1:]
+
+async def _receive_until_ack(session: AsyncTcpSession, complete_response: bytearray) -> None:
+    """ACK/NACK を受信するまでフレームを受信し、complete_response に連結する。"""
+    while True:
+        frame = await session.recv_frame()
+        complete_response.extend(frame)
+        if frame[CMD_LOCATION] in (ACK_I, NACK_I):
+            return
 
-def communicate(session: Optional[TcpSession], command: bytes, timeout: float = 1.0) -> bytes:
+async def communicate_async(session: AsyncTcpSession, command: bytes, timeout: float = 1.0) -> bytes:
     """
     【LAN版】コマンド送信→受信しながら STX/ETX/SUM/CR を検証し、正常フレームのみ連結して返す。
-    ACK/NACK のどちらかを受信したら戻る。timeout 超過でも戻る。
+    ACK/NACK のどちらかを受信したら戻る。timeout 超過や切断でも（途中までの結果を）戻る。
     """
-    complete_response  = b''
-    receive_buffer: List[int] = []
-    buffer_length = 0
-    data_length   = 0
-
-    if session is not None:
-        session.send(command)
-
-    start_time = time.time()
-    while True:
-        if (time.time() - start_time) > timeout:
-            print("タイムアウト: レスポンスが一定時間内に受信されませんでした。")
-            return complete_response
+    complete_response = bytearray()
+    await session.send(command)
 
-        if session is not None:
-            try:
-                chunk = session.recv(1)  # 1バイトずつ受信（USB版と揃える）
-            except socket.timeout:
-                continue  # ソケットタイムアウト → 継続
-            if not chunk:
-                continue  # 切断/未受信
-            receive_buffer += chunk
-            buffer_length = len(receive_buffer)
-
-        if receive_buffer:
-            if receive_buffer[0] == STX[0]:
-                if buffer_length >= HEADER_LENGTH:
-                    data_length = receive_buffer[HEADER_LENGTH - 1]
-                    total_len   = data_length + HEADER_LENGTH + FOOTER_LENGTH
-                    if buffer_length >= total_len:
-                        if receive_buffer[total_len - 1] == CR[0]:
-                            if receive_buffer[data_length + HEADER_LENGTH] == ETX[0]:
-                                frame = bytes(receive_buffer[:total_len])
-                                if verify_sum_value(frame):
-                                    complete_response += frame
-                                    if receive_buffer[CMD_LOCATION] in [ACK[0], NACK[0]]:
-                                        receive_buffer = []
-                                        return complete_response
-                                    receive_buffer = receive_buffer[total_len:]
-                                else:
-                                    # SUM 不一致 → 先頭をずらして同期取り直し
-                                    receive_buffer = receive_buffer[1:]
-                            else:
-                                receive_buffer = receive_buffer[1:]
-                        else:
-                            receive_buffer = receive_buffer[1:]
-                    else:
-                        continue
-                else:
-                    continue
-            else:
-                receive_buffer = receive_buffer[1:]
+    # タイムアウトは受信全体に対して 1 回だけ設定する（フレームごとに wait_for を使うとタスク生成が重い）
+    try:
+        await asyncio.wait_for(_receive_until_ack(session, complete_response), timeout)
+    except asyncio.TimeoutError:
+        print("タイムアウト: レスポンスが一定時間内に受信されませんでした。")
+    except asyncio.IncompleteReadError:
+        print("切断: 装置との接続が閉じられました。")
+    return bytes(complete_response)
 
 # =============================================================================
 #  ブザー制御（LAN版）
 # =============================================================================
-def send_buzzer_command(session: TcpSession, response_type: int, sound_type: int) -> bytes:
+@lru_cache(maxsize=64)
+def _build_buzzer_frame(response_type: int, sound_type: int) -> bytes:
+    """ブザー制御コマンドのフレーム（SUM・CR 込み）を組み立てる。組み合わせごとに結果をキャッシュする。"""
+    data = bytes([response_type, sound_type])
+    header = STX + ADD + BUZ + bytes([len(data)])
+    frame_wo_sum = header + data + ETX
+    sum_value = calculate_sum_value(frame_wo_sum)
+    return frame_wo_sum + bytes([sum_value]) + CR
+
+async def send_buzzer_command_async(session: AsyncTcpSession, response_type: int, sound_type: int) -> bytes:
     """
     ブザー制御コマンド（応答要求:0x01 を想定）。
     response_type: 0x00=応答なし / 0x01=応答あり（本サンプルは 0x01 推奨）
     sound_type   : 0x00=ピー / 0x01=ピッピッピ / ... 0x08=ピッピッピッピッ
     """
-    data = bytes([response_type, sound_type])
-    header = STX + ADD + BUZ + bytes([len(data)])
-    frame_wo_sum = header + data + ETX
-    sum_value = calculate_sum_value(frame_wo_sum)
-    full_command = frame_wo_sum + bytes([sum_value]) + CR
-    return communicate(session, full_command)
+    return await communicate_async(session, _build_buzzer_frame(response_type, sound_type))
 
 # =============================================================================
 #  集計ログ保存
 # =============================================================================
 def save_results_to_file(filename: str, total_iterations: int, total_read_time: float,
                          total_read_count: int, pc_uii_count_dict: dict) -> None:
+    current_datetime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    lines = [
+        "\n# -*- coding: utf-8 -*-\n",
+        f"\n=== 集計結果 ({current_datetime}) ===\n",
+        f"総繰り返し回数: {total_iterations}\n",
+        f"総読み取り時間: {total_read_time:.2f} 秒\n",
+    ]
+    if total_iterations > 0:
+        lines.append(f"平均読み取り枚数: {total_read_count / total_iterations:.2f} 枚\n")
+    lines.append("各PC+UIIデータの読み取り回数:\n")
+    lines.extend(f"{pc_uii_hex}: {count} 回\n" for pc_uii_hex, count in pc_uii_count_dict.items())
+    lines.append("========= ここまで ============\n\n\n")
+
+    # まとめて 1 回で書き込む
     with open(filename, 'a', encoding="utf-8") as f:
-        current_datetime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        f.write("\n# -*- coding: utf-8 -*-\n")
-        f.write(f"\n=== 集計結果 ({current_datetime}) ===\n")
-        f.write(f"総繰り返し回数: {total_iterations}\n")
-        f.write(f"総読み取り時間: {total_read_time:.2f} 秒\n")
-        if total_iterations > 0:
-            f.write(f"平均読み取り枚数: {total_read_count / total_iterations:.2f} 枚\n")
-        f.write("各PC+UIIデータの読み取り回数:\n")
-        for pc_uii_hex, count in pc_uii_count_dict.items():
-            f.write(f"{pc_uii_hex}: {count} 回\n")
-        f.write("========= ここまで ============\n\n\n")
+        f.write(''.join(lines))
 
 # =============================================================================
 #  メイン
 # =============================================================================
-def main():
+async def _timed_inventory(session: AsyncTcpSession) -> Tuple[bytes, float]:
+    """インベントリを 1 回実行し、(受信データ, 所要時間[秒]) を返す。"""
+    start_time = time.monotonic()
+    received_data_bytes = await communicate_async(session, COMMANDS['UHF_INVENTORY'], timeout=3.0)
+    return received_data_bytes, time.monotonic() - start_time
+
+async def main():
     # --- 接続情報の入力 ---
     print("UTR（LANモデル）に接続します。")
     host = input("装置の IP アドレスを入力してください（例: 192.168.0.1）: ").strip()
@@ -312,96 +418,96 @@ def main():
     port = int(port_text) if port_text else 9004
 
     # --- セッション確立 ---
-    session = TcpSession(host, port, timeout=1.0)
+    session = AsyncTcpSession(host, port, timeout=1.0)
     try:
-        session.connect()
+        await session.connect()
         print(f"接続成功: {host}:{port}")
     except Exception as e:
         print(f"接続エラー: {e}")
         sys.exit(1)
 
     # --- ROMバージョンで通信確認 ---
-    result = communicate(session, COMMANDS['ROM_VERSION_CHECK'])
-    if re.match(STX + b'.' + ACK, result):
-        if bytes([result[DETAIL_LOCATION]]) == DETAIL_ROM:
+    result = await communicate_async(session, COMMANDS['ROM_VERSION_CHECK'])
+    if _is_ack(result):
+        if result[DETAIL_LOCATION] == DETAIL_ROM_I:
             print("LAN通信: OK（ROMバージョン ACK 受信）")
-    elif re.match(STX + b'.' + NACK, result):
-        if bytes([result[DETAIL_LOCATION]]) == DETAIL_ROM:
+    elif _is_nack(result):
+        if result[DETAIL_LOCATION] == DETAIL_ROM_I:
             print(parse_nack_response(result))
     else:
         print("LAN通信: NG（ACK/NACK なし）")
-        session.close()
+        await session.close()
         sys.exit(1)
 
     # --- コマンドモード切替 ---
-    result = communicate(session, COMMANDS['COMMAND_MODE_SET'])
-    if re.match(STX + b'.' + ACK, result):
+    result = await communicate_async(session, COMMANDS['COMMAND_MODE_SET'])
+    if _is_ack(result):
         print("コマンドモードに切り替えました")
-    elif re.match(STX + b'.' + NACK, result):
+    elif _is_nack(result):
         print(parse_nack_response(result))
     else:
         print("コマンドモード切替に失敗しました")
-        session.close()
+        await session.close()
         sys.exit(1)
 
     # --- 出力/周波数の読み取り ---
     # 出力
-    result = communicate(session, COMMANDS['UHF_READ_OUTPUT_POWER'])
-    if re.match(STX + b'.' + ACK, result):
+    result = await communicate_async(session, COMMANDS['UHF_READ_OUTPUT_POWER'])
+    if _is_ack(result):
         level_hex = hex(result[8] + result[7])
         output_power_level = int(level_hex, 16) / 10
         print("送信出力値：", output_power_level, "dBm")
-    elif re.match(STX + b'.' + NACK, result):
+    elif _is_nack(result):
         print(parse_nack_response(result))
     else:
         print("通信エラー（UHF_READ_OUTPUT_POWER）")
         print(result.hex())
-        session.close()
+        await session.close()
         sys.exit(1)
 
     # 周波数チャンネル
-    result = communicate(session, COMMANDS['UHF_READ_FREQ_CH'])
-    if re.match(STX + b'.' + ACK, result):
+    result = await communicate_async(session, COMMANDS['UHF_READ_FREQ_CH'])
+    if _is_ack(result):
         output_ch = int(hex(result[7]), 16)
         print("チャンネル番号：", output_ch, "ch")
         if 1 <= output_ch <= len(OUTPUT_CH_FREQ_LIST):
             print("送信周波数：", OUTPUT_CH_FREQ_LIST[output_ch-1], " MHz")
-    elif re.match(STX + b'.' + NACK, result):
+    elif _is_nack(result):
         print(parse_nack_response(result))
     else:
         print("通信エラー（UHF_READ_FREQ_CH）")
         print(result.hex())
-        session.close()
+        await session.close()
         sys.exit(1)
 
     # --- インベントリパラメータ取得/設定（任意） ---
-    result = communicate(session, COMMANDS['UHF_GET_INVENTORY_PARAM'])
-    if re.match(STX + b'.' + ACK, result):
+    result = await communicate_async(session, COMMANDS['UHF_GET_INVENTORY_PARAM'])
+    if _is_ack(result):
         print("UHF_GET_INVENTORY_PARAM が正常に実行されました")
-    elif re.match(STX + b'.' + NACK, result):
+    elif _is_nack(result):
         print(parse_nack_response(result))
     else:
         print("UHF_GET_INVENTORY_PARAM 実行エラー")
         print(result.hex())
-        session.close()
+        await session.close()
         sys.exit(1)
 
-    result = communicate(session, COMMANDS['UHF_SET_INVENTORY_PARAM'])
-    if re.match(STX + b'.' + ACK, result):
+    result = await communicate_async(session, COMMANDS['UHF_SET_INVENTORY_PARAM'])
+    if _is_ack(result):
         print("UHF_SET_INVENTORY_PARAM が正常に実行されました")
-    elif re.match(STX + b'.' + NACK, result):
+    elif _is_nack(result):
         print(parse_nack_response(result))
     else:
         print("UHF_SET_INVENTORY_PARAM 実行エラー")
         print(result.hex())
-        session.close()
+        await session.close()
         sys.exit(1)
 
     # --- 読み取りループ ---
     total_read_time   = 0.0
     total_read_count  = 0
     total_iterations  = 0
-    pc_uii_count_dict = {}
+    pc_uii_count_dict: Counter = Counter()
 
     while True:
         try:
@@ -412,34 +518,40 @@ def main():
         except ValueError as e:
             print(f"エラー: {e}")
 
-    for _ in range(repeat_count):
-        start_time = time.time()
-        received_data_bytes = communicate(session, COMMANDS['UHF_INVENTORY'], timeout=3.0)
+    # 次回のインベントリは前回結果の表示と並行して送信・受信する
+    inventory_task = asyncio.create_task(_timed_inventory(session))
+    for iteration in range(repeat_count):
+        received_data_bytes, read_time = await inventory_task
         pc_uii_data_list, rssi_list, expected_read_count = received_data_parse(received_data_bytes)
-        read_time = time.time() - start_time
 
         total_read_time += read_time
         total_iterations += 1
         if expected_read_count is not None:
             total_read_count += expected_read_count
 
-        for pc_uii_data in pc_uii_data_list:
-            pc_uii_hex = pc_uii_data.hex()
-            pc_uii_count_dict[pc_uii_hex] = pc_uii_count_dict.get(pc_uii_hex, 0) + 1
+        pc_uii_count_dict.update(pc_uii_data.hex() for pc_uii_data in pc_uii_data_list)
 
         if pc_uii_data_list:
-            result = send_buzzer_command(session, 0x01, 0x00)  # 応答あり / ピー
-            if re.match(STX + b'.' + NACK, result):
+            result = await send_buzzer_command_async(session, 0x01, 0x00)  # 応答あり / ピー
+            if _is_nack(result):
                 print("ブザーパラメータが間違っています")
             print("タグを " + str(expected_read_count) + " 枚読み取りました。")
         else:
-            result = send_buzzer_command(session, 0x01, 0x01)  # 応答あり / ピッピッピ
-            if re.match(STX + b'.' + NACK, result):
+            result = await send_buzzer_command_async(session, 0x01, 0x01)  # 応答あり / ピッピッピ
+            if _is_nack(result):
                 print("ブザーパラメータが間違っています")
             print("タグが見つかりませんでした")
 
-        for pc_uii_data, rssi_value in zip(pc_uii_data_list, rssi_list):
-            print("RSSI値:", rssi_value, "/ PC+UIIデータ:", pc_uii_data.hex())
+        if iteration + 1 < repeat_count:
+            inventory_task = asyncio.create_task(_timed_inventory(session))
+            await asyncio.sleep(0)  # タスクを開始させ、コマンドを先に送信させる
+
+        if pc_uii_data_list:
+            # タグごとに print せず、まとめて 1 回で出力する。
+            # 出力は別スレッドで行い、その間もイベントループを止めない（次回インベントリの所要時間に表示時間を含めないため）
+            text = "\n".join(f"RSSI値: {rssi_value} / PC+UIIデータ: {pc_uii_data.hex()}"
+                              for pc_uii_data, rssi_value in zip(pc_uii_data_list, rssi_list))
+            await asyncio.to_thread(print, text)
 
     # --- 集計出力 ---
     print("\n=== 集計結果 ===")
@@ -455,7 +567,7 @@ def main():
     filename = "Inventory_result_LAN.log"
     save_results_to_file(filename, total_iterations, total_read_time, total_read_count, pc_uii_count_dict)
 
-    session.close()
+    await session.close()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
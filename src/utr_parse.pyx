@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# -*- coding: utf-8 -*-
+
+"""
+UTR-S201 シリーズ（LAN接続）受信データのフレーム走査（Cython 版・任意）
+
+UTR_LAN_sample の _scan_frames() から、ビルド済みの場合のみ使用されます。
+ビルド例（Cython と C コンパイラが必要）:
+    cythonize -i src/utr_parse.pyx
+"""
+
+cdef enum:
+    STX           = 0x02  # Start Text
+    CR            = 0x0D  # Carriage Return
+    HEADER_LENGTH = 4     # STX, アドレス, コマンド, データ長 (各1バイト)
+    FOOTER_LENGTH = 3     # ETX, SUM, CR (各1バイト)
+
+def scan_frames(const unsigned char[:] buf):
+    """
+    受信データを走査し、SUM 検証済みフレームの (開始位置, 終了位置) のリストと、
+    SUM 不一致で走査を打ち切ったかどうかを返す（_scan_frames_py と同じ判定）。
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j, total_len
+    cdef unsigned char sum_value  # 1 バイトで桁あふれさせて下位 1 バイトを得る
+    spans = []
+
+    while i < n:
+        if buf[i] != STX:
+            i += 1
+            continue
+        if n < i + HEADER_LENGTH + FOOTER_LENGTH:
+            break
+        total_len = buf[i + 3] + HEADER_LENGTH + FOOTER_LENGTH
+        if n < i + total_len or buf[i + total_len - 1] != CR:
+            break
+
+        sum_value = 0
+        for j in range(i, i + total_len - 2):
+            sum_value += buf[j]
+        if sum_value != buf[i + total_len - 2]:
+            return spans, True
+
+        spans.append((i, i + total_len))
+        i += total_len
+    return spans, False